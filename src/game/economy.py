@@ -6,13 +6,36 @@ future UI layers (CLI, GUI, tests) can all share the same persistence rules.
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 DEFAULT_STARTING_BALANCE = 10
 DEFAULT_TICKET_COST = 1
 DEFAULT_LINE_PRIZE = 5
 DEFAULT_BINGO_MULTIPLIER = 4
+# Number of buffered balance changes after which the wallet is flushed even
+# without an explicit checkpoint.
+DEFAULT_FLUSH_THRESHOLD = 16
+
+# Parsed wallet files keyed by path. An entry is reused only while the file's
+# (mtime_ns, size) stamp is unchanged, so repeated BalanceManager
+# constructions in one process skip re-opening and re-parsing the file.
+_WALLET_CACHE: Dict[str, Tuple[Tuple[int, int], Optional[int]]] = {}
+
+
+def _file_stamp(path: Path) -> Tuple[int, int]:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _parse_wallet(path: Path) -> Optional[int]:
+    """Return the stored balance, or None if the file is missing or malformed."""
+    try:
+        data = json.loads(path.read_text())
+        return int(data["balance"])
+    except (OSError, KeyError, json.JSONDecodeError, ValueError, TypeError):
+        return None
 
 
 class BalanceManager:
@@ -25,18 +48,24 @@ class BalanceManager:
         ticket_cost: int = DEFAULT_TICKET_COST,
         line_prize: int = DEFAULT_LINE_PRIZE,
         bingo_prize: Optional[int] = None,
+        flush_threshold: int = DEFAULT_FLUSH_THRESHOLD,
     ) -> None:
         root = Path(__file__).resolve().parents[2]
         if storage_path is None:
             storage_path = root / "data" / "wallet.json"
         self._storage_path = storage_path
+        self._storage_path.parent.mkdir(parents=True, exist_ok=True)
         self._starting_balance = max(0, int(starting_balance))
         self.ticket_cost = max(0, int(ticket_cost))
         self.line_prize = max(0, int(line_prize))
         if bingo_prize is None:
             bingo_prize = self.line_prize * DEFAULT_BINGO_MULTIPLIER
         self.bingo_prize = max(0, int(bingo_prize))
+        self.flush_threshold = max(1, int(flush_threshold))
         self._balance: Optional[int] = None
+        # Balance changes are buffered in memory and persisted by flush().
+        self._dirty = False
+        self._pending_writes = 0
 
     # ------------------------------------------------------------------
     # Persistence helpers
@@ -47,20 +76,46 @@ class BalanceManager:
         self._balance = self._read_from_disk()
 
     def _read_from_disk(self) -> int:
+        key = str(self._storage_path)
         try:
-            data = json.loads(self._storage_path.read_text())
-            balance = int(data.get("balance", self._starting_balance))
+            stamp = _file_stamp(self._storage_path)
         except FileNotFoundError:
-            balance = self._starting_balance
-        except (json.JSONDecodeError, ValueError, TypeError):
-            # Treat malformed files as reset to starting balance.
+            return self._starting_balance
+        cached = _WALLET_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            balance = cached[1]
+        else:
+            balance = _parse_wallet(self._storage_path)
+            _WALLET_CACHE[key] = (stamp, balance)
+        if balance is None:
+            # Treat missing or malformed files as reset to starting balance.
             balance = self._starting_balance
         return max(0, balance)
 
     def _write_to_disk(self) -> None:
-        self._storage_path.parent.mkdir(parents=True, exist_ok=True)
-        payload = {"balance": self._balance}
-        self._storage_path.write_text(json.dumps(payload, indent=2))
+        # Write to a sibling temp file and atomically swap it in so a crash
+        # mid-write never leaves a truncated wallet behind. The schema is a
+        # single int, so the compact JSON is formatted directly; reads still
+        # go through json.loads and accept older pretty-printed files.
+        payload = b'{"balance":%d}' % self._balance
+        tmp_path = self._storage_path.with_suffix(".tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, self._storage_path)
+        _WALLET_CACHE[str(self._storage_path)] = (_file_stamp(self._storage_path), self._balance)
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        self._pending_writes += 1
+        if self._pending_writes >= self.flush_threshold:
+            self.flush()
+
+    def flush(self) -> None:
+        """Persist buffered balance changes, if any, with a single write."""
+        if not self._dirty:
+            return
+        self._write_to_disk()
+        self._dirty = False
+        self._pending_writes = 0
 
     # ------------------------------------------------------------------
     # Public API
@@ -72,19 +127,21 @@ class BalanceManager:
 
     def set_balance(self, value: int) -> int:
         self._balance = max(0, int(value))
-        self._write_to_disk()
+        self._dirty = True
+        self.flush()
         return self._balance
 
     def adjust_balance(self, delta: int) -> int:
         self._ensure_loaded()
         assert self._balance is not None
         self._balance = max(0, self._balance + int(delta))
-        self._write_to_disk()
+        self._mark_dirty()
         return self._balance
 
     def reset(self) -> int:
         self._balance = self._starting_balance
-        self._write_to_disk()
+        self._dirty = True
+        self.flush()
         return self._balance
 
     # ------------------------------------------------------------------
@@ -92,6 +149,8 @@ class BalanceManager:
     # ------------------------------------------------------------------
     def can_afford_ticket(self, quantity: int = 1) -> bool:
         cost = self.ticket_cost * max(1, int(quantity))
+        if cost == 0:
+            return True
         return self.get_balance() >= cost
 
     def spend_for_tickets(self, quantity: int = 1) -> int:
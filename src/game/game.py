@@ -1,5 +1,7 @@
 ﻿import random
-from typing import List, Optional, Set, FrozenSet
+from dataclasses import dataclass, field
+from itertools import permutations
+from typing import Collection, Dict, Iterable, List, Optional, Sequence, Set, FrozenSet, Tuple, Union
 
 """Clean bingo game utilities used by tests.
 
@@ -7,155 +9,557 @@ Exports:
 - generate_ticket_9x3(rnd, seed) -> Grid
 - generate_unique_tickets(count, seed) -> List[Grid]
 - NumberDrawer: simple deterministic-friendly drawer with .draw_next()
-- check_bingo_complete(ticket, drawn_set) -> bool
+- check_bingo_complete(ticket, drawn) -> bool, `drawn` a set or a DrawnBitmap
+- new_drawn_bitmap() -> DrawnBitmap: byte-table alternative to a drawn set
+- flat_cells_drawn(cells, drawn): whether every number in FlatGrid cells is drawn
+- ticket_mask(ticket) / row_masks(ticket): int bitmasks (bit n set for number n)
+- check_bingo_complete_mask / check_line_complete_mask: bitmask versions of the checks
+- Ticket.from_grid(grid): grid plus cached per-row and whole-ticket number sets
+- TicketTracker(tickets): incremental line/bingo detection across many tickets
+- acquire_grid() / release_grid(grid): free list of spare 3x9 grids
+- flatten_grid(grid) -> FlatGrid / unflatten_grid(flat) -> Grid: compact 27-byte tickets
+- grid_rows(ticket): the three rows of either grid form
 
 This module is intentionally small and deterministic when a seed is provided.
 """
 
 Grid = List[List[Optional[int]]]
+# A ticket packed row-major into 27 bytes (cell r, c at index r*9+c), with 0
+# marking an empty cell. One contiguous object instead of 4 lists + 27 refs.
+FlatGrid = bytearray
+AnyGrid = Union[Grid, FlatGrid]
+# Drawn numbers as a byte table from `new_drawn_bitmap`: byte n is nonzero
+# once n has been drawn. The check functions accept it anywhere they accept a
+# drawn set; against a FlatGrid, `flat.translate(bitmap)` then maps all 27
+# cells to drawn flags in one C call.
+DrawnBitmap = bytearray
+Drawn = Union[Set[int], FrozenSet[int], DrawnBitmap, Collection[int]]
+
+
+# Numbers allowed in each column, as (first number, how many).
+_COL_SPANS = (
+    (1, 9),         # 1-9
+    (10, 10),       # 10-19
+    (20, 10),
+    (30, 10),
+    (40, 10),
+    (50, 10),
+    (60, 10),
+    (70, 10),
+    (80, 11),       # 80-90 inclusive
+)
+# Each column index once per slot of spare capacity above its first number:
+# the population for the per-column count draw in _build_ticket. Spelled
+# out rather than passed as sample(..., counts=) which rebuilds cumulative
+# weights and bisects on every call.
+_COL_SLOTS = tuple(c for c in range(9) for _ in range(2))
+# Every callable number, one byte each; NumberDrawer copies this instead of
+# rebuilding a range.
+_ALL_NUMBERS = bytes(range(1, 91))
+
+
+# Free list of spare 3x9 grids. Tickets rejected as duplicates are handed
+# back here and reused by the next generate_ticket_9x3 call instead of
+# allocating four fresh lists.
+_GRID_POOL: List[Grid] = []
+_GRID_POOL_MAX = 16
+
+
+def acquire_grid() -> Grid:
+    """Return an empty 3x9 grid, reusing a released one when available."""
+    if not _GRID_POOL:
+        return [[None] * 9 for _ in range(3)]
+    grid = _GRID_POOL.pop()
+    for row in grid:
+        row[:] = [None] * 9
+    return grid
+
+
+def release_grid(grid: Grid) -> None:
+    """Hand a grid that is no longer referenced back to the pool."""
+    if len(_GRID_POOL) < _GRID_POOL_MAX:
+        _GRID_POOL.append(grid)
+
+
+_ALL_ROWS = (0, 1, 2)
+
+
+def _two_smallest(row_counts: List[int]) -> Tuple[int, int]:
+    """Ascending indices of the two smallest of three counts; ties favour lower rows."""
+    a, b, c = row_counts
+    # drop the row a stable sort would put last: largest count, highest index on ties
+    if c >= a and c >= b:
+        return (0, 1)
+    if b >= a:
+        return (0, 2)
+    return (1, 2)
 
 
-def _default_col_ranges():
-    return [
-        list(range(1, 10)),        # 1-9
-        list(range(10, 20)),       # 10-19
-        list(range(20, 30)),
-        list(range(30, 40)),
-        list(range(40, 50)),
-        list(range(50, 60)),
-        list(range(60, 70)),
-        list(range(70, 80)),
-        list(range(80, 91)),       # 80-90 inclusive
-    ]
+def _one_smallest(row_counts: List[int]) -> int:
+    """Index of the smallest of three counts; ties favour lower rows."""
+    a, b, c = row_counts
+    if a <= b and a <= c:
+        return 0
+    if b <= c:
+        return 1
+    return 2
+
+
+# Row layouts per per-column count vector, filled lazily by _build_ticket.
+# Only 1554 vectors satisfy the ticket constraints, so this stays small.
+_ROW_LAYOUTS: Dict[Tuple[int, ...], Tuple[Tuple[Tuple[int, ...], ...], ...]] = {}
+# Every relabelling of the three rows, one per tie-break priority order.
+_ROW_ORDERS = tuple(permutations(_ALL_ROWS))
+
+
+def _row_layouts(counts: Tuple[int, ...]) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """Return the ascending rows each column's numbers go to, given `counts`.
+
+    Assign rows greedily: 3-number columns fill every row, then 2-number
+    columns take the two emptiest rows, then 1-number columns the emptiest
+    one. For 15 numbers over 9 columns of 1..3 this always ends with 5 per
+    row, so no retry is needed.
+
+    Ties between equally empty rows go to the lower row. The greedy pass
+    treats all rows alike, so breaking ties in another priority order gives
+    the same layout with its rows relabelled. One layout is returned per
+    entry of `_ROW_ORDERS`, and the caller picks one at random.
+    """
+    row_counts = [0] * 3
+    layout: List[Tuple[int, ...]] = [()] * len(counts)
+    for k in (3, 2, 1):
+        for col, n in enumerate(counts):
+            if n != k:
+                continue
+            if k == 3:
+                rows = _ALL_ROWS
+            elif k == 2:
+                rows = _two_smallest(row_counts)
+            else:
+                rows = (_one_smallest(row_counts),)
+            for r in rows:
+                row_counts[r] += 1
+            layout[col] = rows
+
+    assert row_counts == [5, 5, 5], f"unexpected row counts: {row_counts}"
+    return tuple(
+        tuple(tuple(sorted(order[r] for r in rows)) for rows in layout)
+        for order in _ROW_ORDERS
+    )
+
+
+def _pick_k_sorted(getrandbits, base: int, size: int, k: int) -> List[int]:
+    """Return `k` distinct numbers from base..base+size-1 in ascending order.
+
+    Picks are collected as bits of an int, so reading the set bits from the
+    low end yields them already sorted: no sample() pool copy and no sort.
+    Out-of-range draws are rejected, which keeps every pick uniform.
+    """
+    bits = size.bit_length()
+    mask = 0
+    while mask.bit_count() < k:
+        i = getrandbits(bits)
+        if i < size:
+            mask |= 1 << i
+    picked = []
+    while mask:
+        low = mask & -mask
+        picked.append(base + low.bit_length() - 1)
+        mask ^= low
+    return picked
 
 
 def generate_ticket_9x3(rnd: Optional[random.Random] = None, seed: Optional[int] = None) -> Grid:
     """Generate a single 9x3 UK-style bingo ticket.
 
-    The ticket is a list of 3 rows, each row a list of 9 cells where empty
-    cells are `None` and filled cells are integers. Exactly 15 numbers are
-    present and each row contains exactly 5 numbers.
+    Args:
+        rnd: optional random.Random instance to use (preferred for deterministic sequences).
+        seed: optional int seed (used only if rnd is None).
+
+    Returns:
+        grid: 3x9 nested list, empty cells are None.
+
+    The algorithm follows standard UK constraints:
+    - exactly 15 numbers total
+    - each row has exactly 5 numbers
+    - each column has 1..3 numbers
+    - numbers per column come from fixed ranges
+    - numbers in each column are sorted top-to-bottom
     """
     if rnd is None:
         rnd = random.Random(seed)
+    return _build_ticket(rnd)[0]
 
-    col_ranges = _default_col_ranges()
-
-    # Determine how many numbers per column: start with 1 per column, then
-    # distribute the remaining (15 - 9 = 6) across columns not exceeding 3.
-    counts = [1] * 9
-    remaining = 15 - 9
-    cols = list(range(9))
-    while remaining > 0:
-        c = rnd.choice(cols)
-        if counts[c] < 3:
-            counts[c] += 1
-            remaining -= 1
-
-    # Pick numbers for each column
-    col_numbers = []
-    for c in range(9):
-        pool = list(col_ranges[c])
-        nums = rnd.sample(pool, counts[c])
-        nums.sort()
-        col_numbers.append(nums)
-
-    # Decide which rows get numbers for each column such that each row ends up
-    # with exactly 5 numbers. Greedy assignment works: handle columns with 3
-    # first (one per row), then 2, then 1, assigning to rows with smallest
-    # current count.
-    row_counts = [0, 0, 0]
-    rows_for_col = [None] * 9
-
-    # columns grouped by count
-    cols_by_count = {1: [], 2: [], 3: []}
-    for i, c in enumerate(counts):
-        cols_by_count[c].append(i)
-
-    # assign 3-number columns
-    for c in cols_by_count[3]:
-        rows_for_col[c] = [0, 1, 2]
-        row_counts = [rc + 1 for rc in row_counts]
-
-    # assign 2-number columns: choose two rows with smallest counts
-    for c in cols_by_count[2]:
-        idxs = sorted(range(3), key=lambda r: row_counts[r])[:2]
-        rows_for_col[c] = idxs
-        for r in idxs:
-            row_counts[r] += 1
-
-    # assign 1-number columns: choose the row with smallest count
-    for c in cols_by_count[1]:
-        r = min(range(3), key=lambda r: row_counts[r])
-        rows_for_col[c] = [r]
-        row_counts[r] += 1
-
-    # sanity: each row should have exactly 5 numbers
-    assert all(rc == 5 for rc in row_counts), f"unexpected row counts: {row_counts}"
-
-    # build grid and place numbers per column; within a column numbers are
-    # placed top-to-bottom according to row index ordering
-    grid: Grid = [[None for _ in range(9)] for _ in range(3)]
-    for c in range(9):
-        assigned_rows = sorted(rows_for_col[c])
-        nums = col_numbers[c]
-        # place numbers in increasing row order to keep column sorted
-        for r_idx, r in enumerate(assigned_rows):
-            grid[r][c] = nums[r_idx]
 
-    return grid
+def _build_ticket(rnd: random.Random) -> Tuple[Grid, int]:
+    """Core of `generate_ticket_9x3`, also returning the ticket's `ticket_mask`.
+
+    The mask is accumulated while numbers are placed, so bulk callers such as
+    `generate_unique_tickets` get their dedup key without rescanning the grid.
+    """
+    TARGET_NUMBERS = 15
+    COLS = 9
+    MIN_PER_COL = 1
+
+    counts = [MIN_PER_COL] * COLS
+    remaining = TARGET_NUMBERS - sum(counts)
+
+    # spread the extra numbers in one call: each column index appears twice
+    # in the population (3 per column minus the first), so sampling without
+    # replacement can never push a column past 3 numbers
+    for c in rnd.sample(_COL_SLOTS, remaining):
+        counts[c] += 1
+
+    # Pick numbers for each column. A single rnd.sample(range(1, 91), 15)
+    # bucketed by column looks cheaper, but only ~13% of such samples give
+    # every column 1..3 numbers, so the per-column draw is kept.
+    # bind the RNG method once: it is called at least 15 times per ticket
+    getrandbits = rnd.getrandbits
+    col_numbers = [_pick_k_sorted(getrandbits, base, size, k) for (base, size), k in zip(_COL_SPANS, counts)]
+
+    # the row placement depends only on the count vector and the tie-break
+    # order, so it is worked out once per vector and replayed from then on
+    key = tuple(counts)
+    layouts = _ROW_LAYOUTS.get(key)
+    if layouts is None:
+        layouts = _ROW_LAYOUTS[key] = _row_layouts(key)
+    layout = rnd.choice(layouts)
+
+    grid = acquire_grid()
+    mask = 0
+    for col, rows in enumerate(layout):
+        for row_idx, num in zip(rows, col_numbers[col]):
+            grid[row_idx][col] = num
+            mask |= 1 << num
+    return grid, mask
+
+
+def ticket_numbers_set(ticket: Union[AnyGrid, "Ticket"]) -> FrozenSet[int]:
+    """Return the set of numbers present on a ticket as an immutable key.
+
+    Two tickets are considered identical if they contain the same 15 numbers
+    regardless of position. Accepts a Grid, a FlatGrid or a `Ticket`, whose
+    cached set is returned without rescanning.
+    """
+    if isinstance(ticket, Ticket):
+        return ticket.all_nums
+    return frozenset(_numbers(ticket))
+
+
+def flatten_grid(grid: Grid) -> FlatGrid:
+    """Pack a nested 3x9 `grid` into a `FlatGrid`."""
+    return bytearray(n or 0 for row in grid for n in row)
+
+
+def unflatten_grid(flat: FlatGrid) -> Grid:
+    """Inverse of `flatten_grid`."""
+    return [[flat[r * 9 + c] or None for c in range(9)] for r in range(3)]
+
+
+def grid_rows(ticket: AnyGrid) -> Sequence[Sequence[Optional[int]]]:
+    """Return the three rows of a Grid or FlatGrid; empty cells are falsy."""
+    if isinstance(ticket, bytearray):
+        return [ticket[r * 9:(r + 1) * 9] for r in range(3)]
+    return ticket
 
 
-def ticket_numbers_set(ticket: Grid) -> FrozenSet[int]:
-    return frozenset(n for row in ticket for n in row if n is not None)
+def _numbers(ticket: AnyGrid) -> Iterable[int]:
+    if isinstance(ticket, bytearray):
+        # a single C-level pass dropping the 0 (empty) cells
+        return filter(None, ticket)
+    return (n for row in ticket for n in row if n is not None)
 
 
-def generate_unique_tickets(count: int, seed: Optional[int] = None) -> List[Grid]:
+def ticket_mask(ticket: AnyGrid) -> int:
+    """Encode the numbers on `ticket` as an int with bit `n` set for number `n`."""
+    # plain loops beat reduce() over a generator: no per-number frame resume
+    mask = 0
+    if isinstance(ticket, bytearray):
+        for n in filter(None, ticket):
+            mask |= 1 << n
+        return mask
+    for row in ticket:
+        for n in row:
+            if n is not None:
+                mask |= 1 << n
+    return mask
+
+
+def row_masks(ticket: AnyGrid) -> Tuple[int, ...]:
+    """Return one `ticket_mask`-style bitmask per row of `ticket`."""
+    masks = []
+    for row in grid_rows(ticket):
+        mask = 0
+        for n in row:
+            if n:
+                mask |= 1 << n
+        masks.append(mask)
+    return tuple(masks)
+
+
+# Seeded generate_unique_tickets results, stored immutably and handed out as
+# fresh lists, so repeated calls with the same seed skip the generation.
+_TICKET_CACHE: Dict[Tuple[int, int, int], Tuple[Tuple[Tuple[Optional[int], ...], ...], ...]] = {}
+_TICKET_CACHE_MAX = 128
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Ticket:
+    """A grid bundled with number views precomputed once at creation.
+
+    `row_nums` holds the five numbers of each row with the empty cells
+    already dropped, so line checks are a single `drawn.issuperset(row)`;
+    `nums` lists all 15 in ascending order for callers that only need them.
+    """
+
+    grid: AnyGrid
+    row_nums: Tuple[Tuple[int, ...], ...]
+    all_nums: FrozenSet[int]
+    nums: Tuple[int, ...]
+
+    @classmethod
+    def from_grid(cls, grid: AnyGrid) -> "Ticket":
+        row_nums = tuple(tuple(filter(None, row)) for row in grid_rows(grid))
+        nums = tuple(sorted(n for row in row_nums for n in row))
+        return cls(grid, row_nums, frozenset(nums), nums)
+
+
+def generate_unique_tickets(count: int, seed: Optional[int] = None, max_attempts_per_ticket: int = 5000) -> List[Grid]:
+    """Generate `count` unique tickets (unique by number-set) using a single RNG.
+
+    Args:
+        count: number of tickets to generate
+        seed: optional seed for deterministic behavior
+        max_attempts_per_ticket: how many retries to try per ticket before failing
+    Returns:
+        list of unique Grid objects; seeded results are cached and returned
+        as fresh copies on later calls
+    Raises:
+        RuntimeError if unable to produce the required number of unique tickets
+    """
+    if count <= 0:
+        return []
+
+    cache_key = (count, seed, max_attempts_per_ticket)
+    cached = _TICKET_CACHE.get(cache_key) if seed is not None else None
+    if cached is not None:
+        return [[list(row) for row in grid] for grid in cached]
+
     rnd = random.Random(seed)
-    tickets = []
-    seen: Set[FrozenSet[int]] = set()
-    attempts = 0
-    while len(tickets) < count and attempts < count * 50:
-        t = generate_ticket_9x3(rnd=rnd)
-        s = ticket_numbers_set(t)
-        if s not in seen:
-            seen.add(s)
-            tickets.append(t)
-        attempts += 1
-    if len(tickets) < count:
-        raise RuntimeError("could not generate enough unique tickets")
+    # ticket_mask ints are cheaper to build and hash than a frozenset of 15
+    seen: Set[int] = set()
+    tickets: List[Grid] = []
+
+    for i in range(count):
+        attempts = 0
+        while attempts < max_attempts_per_ticket:
+            # share the RNG so sequences are deterministic and reproducible
+            ticket, key = _build_ticket(rnd)
+            # construction always places 15 numbers (the generator tests
+            # cover it), so the guard only runs when asserts are enabled
+            assert key.bit_count() == 15, f"malformed ticket: {ticket}"
+            if key not in seen:
+                seen.add(key)
+                tickets.append(ticket)
+                break
+            release_grid(ticket)
+            attempts += 1
+
+        if attempts >= max_attempts_per_ticket:
+            raise RuntimeError(f"Failed to generate a unique ticket #{i+1} after {attempts} attempts")
+
+    if seed is not None:
+        if len(_TICKET_CACHE) >= _TICKET_CACHE_MAX:
+            # evict the oldest entry; dicts keep insertion order
+            del _TICKET_CACHE[next(iter(_TICKET_CACHE))]
+        _TICKET_CACHE[cache_key] = tuple(tuple(tuple(row) for row in grid) for grid in tickets)
     return tickets
 
 
-def check_bingo_complete(ticket: Grid, drawn: Set[int]) -> bool:
-    """Return True if all 15 numbers on `ticket` are in `drawn`."""
-    nums = ticket_numbers_set(ticket)
-    return nums.issubset(drawn)
+def new_drawn_bitmap() -> DrawnBitmap:
+    """Return an empty `DrawnBitmap`.
+
+    It spans all 256 byte values so FlatGrid checks can use
+    bytearray.translate, and byte 0 is preset so empty cells translate to
+    "drawn". Any bytearray indexed by number (e.g. `bytearray(91)`) is also
+    accepted by the checks; it just takes the slower indexing path.
+    """
+    bitmap = bytearray(256)
+    bitmap[0] = 1
+    return bitmap
+
+
+def drawn_lookup(drawn: Drawn):
+    """Return a callable telling whether a number is in `drawn` (container or DrawnBitmap)."""
+    # `n in bytearray` would search for a byte value, so index the table instead
+    return drawn.__getitem__ if isinstance(drawn, bytearray) else drawn.__contains__
 
 
+def flat_cells_drawn(cells: FlatGrid, drawn: DrawnBitmap) -> bool:
+    """Return True if every number in `cells` (a FlatGrid or a slice of one) is set in `drawn`."""
+    if len(drawn) != 256:
+        # bytearray.translate needs a full 256-entry table
+        return all(map(drawn.__getitem__, filter(None, cells)))
+    # translate maps every cell to its flag in one C call; empty cells map to
+    # drawn[0], so their zeros only count as undrawn when that entry is unset
+    undrawn = cells.translate(drawn).count(0)
+    return undrawn == (0 if drawn[0] else cells.count(0))
+
+
+def check_bingo_complete(ticket: Union[AnyGrid, Ticket], drawn: Drawn) -> bool:
+    """Return True if all 15 numbers on `ticket` are in `drawn`."""
+    if isinstance(drawn, bytearray):
+        if isinstance(ticket, Ticket):
+            ticket = ticket.grid
+        if isinstance(ticket, bytearray):
+            return flat_cells_drawn(ticket, drawn)
+    elif isinstance(ticket, Ticket):
+        # one C-level subset test against the cached frozenset; issubset
+        # takes any iterable, so tuple or list histories work too
+        return ticket.all_nums.issubset(drawn)
+    # all() over map() runs the membership loop in C and stops at the first
+    # undrawn number, without building a frozenset per check
+    return all(map(drawn_lookup(drawn), _numbers(ticket)))
+
+
+def check_bingo_complete_mask(mask: int, drawn_mask: int) -> bool:
+    """Bitmask version of `check_bingo_complete` for a precomputed `ticket_mask`."""
+    return mask & ~drawn_mask == 0
+
+
+def check_line_complete_mask(masks: Sequence[int], drawn_mask: int) -> Optional[int]:
+    """Return the index of the first row mask fully covered by `drawn_mask`, or None."""
+    for r, mask in enumerate(masks):
+        if mask & ~drawn_mask == 0:
+            return r
+    return None
+
+
+class TicketTracker:
+    """Incremental line and bingo detection for a batch of tickets.
+
+    An inverted index from each number to its (ticket id, row) positions is
+    built once, so a draw only touches the tickets holding that number
+    instead of rescanning every ticket. Each number must be drawn at most
+    once, as `NumberDrawer` guarantees.
+    """
+
+    def __init__(self, tickets: Sequence[AnyGrid]):
+        self.line_remaining: List[List[int]] = []
+        self.bingo_remaining: List[int] = []
+        # indexed by number; a list lookup is cheaper than a dict probe
+        self.number_to_positions: List[List[Tuple[int, int]]] = [[] for _ in range(91)]
+        for tid, ticket in enumerate(tickets):
+            line_remaining = []
+            for r, row in enumerate(grid_rows(ticket)):
+                nums = [n for n in row if n]
+                for n in nums:
+                    self.number_to_positions[n].append((tid, r))
+                line_remaining.append(len(nums))
+            self.line_remaining.append(line_remaining)
+            self.bingo_remaining.append(sum(line_remaining))
+
+    def draw(self, n: int) -> List[int]:
+        """Count `n` as drawn on every ticket that holds it.
+
+        Returns the ids of the tickets this draw completed, so batch callers
+        never have to poll every ticket for bingo.
+        """
+        completed = []
+        bingo_remaining = self.bingo_remaining
+        for tid, row in self.number_to_positions[n]:
+            self.line_remaining[tid][row] -= 1
+            bingo_remaining[tid] -= 1
+            if not bingo_remaining[tid]:
+                completed.append(tid)
+        return completed
+
+    def line_complete(self, tid: int) -> Optional[int]:
+        """Return the first complete row of ticket `tid`, or None."""
+        line_remaining = self.line_remaining[tid]
+        return line_remaining.index(0) if 0 in line_remaining else None
+
+    def bingo_complete(self, tid: int) -> bool:
+        return self.bingo_remaining[tid] == 0
+
+
+@dataclass(slots=True, init=False, eq=False)
 class NumberDrawer:
-    """Simple number drawer for 1..90. Tests may override internals for
-    deterministic behavior by setting `._pool` and clearing `._drawn`.
+    """Drawer for numbers 1 to 90 with no duplicates.
+
+    The pool is shuffled once per `reset` and drawn from the front by
+    advancing a cursor. Pass `seed` (or an `rnd` instance) for a reproducible
+    order; tests may also assign `_pool` directly to script the draw order.
+
+    Usage:
+        d = NumberDrawer(seed=42)
+        n = d.draw_next()
+        history = d.drawn()
+        remaining = d.remaining_count()
     """
 
-    def __init__(self, rnd: Optional[random.Random] = None):
-        self.rnd = rnd or random.Random()
-        self._pool = list(range(1, 91))
+    rnd: Optional[random.Random] = field(default=None, repr=False)
+    seed: Optional[int] = None
+    # the draw order as one byte per number instead of 90 list slots
+    _order: bytearray = field(init=False, repr=False)
+    # index of the next number in `_order`; drawing just advances it
+    _cursor: int = field(init=False, repr=False)
+    _drawn: List[int] = field(init=False, repr=False)
+
+    def __init__(self, rnd: Union[random.Random, int, None] = None, seed: Optional[int] = None) -> None:
+        # the first positional argument has been an rnd instance
+        # (NumberDrawer(random.Random(1))) and a seed (NumberDrawer(42)) in
+        # the two drawers this class replaced; accept both
+        if isinstance(rnd, int):
+            rnd, seed = None, rnd
+        self.rnd = rnd
+        self.seed = seed
+        self.reset()
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        """Refill and reshuffle the pool.
+
+        Reseeds from `seed` (or the constructor seed), unless an `rnd`
+        instance was injected and no new seed is given.
+        """
+        if seed is not None:
+            self.seed = seed
+        rnd = self.rnd if self.rnd is not None and seed is None else random.Random(self.seed)
+        order = list(_ALL_NUMBERS)
+        # list swaps are cheaper than bytearray ones; pack after shuffling
+        rnd.shuffle(order)
+        self._order = bytearray(order)
+        self._cursor = 0
         self._drawn = []
 
+    @property
+    def _pool(self) -> List[int]:
+        """The numbers not drawn yet, in draw order."""
+        return list(self._order[self._cursor:])
+
+    @_pool.setter
+    def _pool(self, numbers: Iterable[int]) -> None:
+        # replacing the pool restarts the cursor so a scripted order is
+        # drawn from its first element
+        self._order = bytearray(numbers)
+        self._cursor = 0
+
     def draw_next(self) -> int:
-        if not self._pool:
-            raise StopIteration("no more numbers")
-        # draw from front to allow tests to set pool order deterministically
-        n = self._pool.pop(0)
+        """Draw the next number. Raises StopIteration when pool exhausted."""
+        if self._cursor >= len(self._order):
+            raise StopIteration("All numbers have been drawn")
+        n = self._order[self._cursor]
+        self._cursor += 1
         self._drawn.append(n)
         return n
 
-    def drawn(self) -> List[int]:
-        return list(self._drawn)
+    def drawn(self) -> Tuple[int, ...]:
+        """Draw history as an immutable snapshot."""
+        return tuple(self._drawn)
 
-    def remaining(self) -> List[int]:
-        return list(self._pool)
+    def remaining(self) -> Tuple[int, ...]:
+        # slicing a memoryview copies nothing, so the tuple is the only copy
+        return tuple(memoryview(self._order)[self._cursor:])
 
     def remaining_count(self) -> int:
-        return len(self._pool)
+        return len(self._order) - self._cursor
@@ -1,166 +1,80 @@
-import random
-from typing import List, Optional, Set, FrozenSet
-
-"""ticket_generator.py
+import argparse
+from typing import Any, Dict, NamedTuple, Optional, Sequence, Set, Union
+
+try:
+    from .economy import BalanceManager
+    from .game import (  # generation helpers are re-exported for existing callers
+        AnyGrid,
+        Drawn,
+        FlatGrid,
+        Grid,
+        NumberDrawer,
+        Ticket,
+        check_bingo_complete,
+        drawn_lookup,
+        flat_cells_drawn,
+        flatten_grid,
+        generate_ticket_9x3,
+        generate_unique_tickets,
+        grid_rows,
+        new_drawn_bitmap,
+        release_grid,
+        ticket_numbers_set,
+    )
+except ImportError as exc:  # run as a plain script instead of a package module
+    raise SystemExit(f"Run the demo as a package module: `python -m game.main` from src ({exc})")
+
+"""Terminal front end for the bingo game.
 
 Implements:
-- generate_ticket_9x3: produce a single UK-style 9x3 ticket (15 numbers)
-- generate_unique_tickets: produce multiple tickets ensuring uniqueness by number set
 - print_ticket: improved terminal renderer
-- NumberDrawer: draws numbers 1..90 without duplicates and keeps history
+- check_line_complete / validate_*_claim: claim validation against drawn sets
+- GameRound: I/O-free state for one player-vs-bot round
+- play_interactive_demo / main: the interactive CLI
 
-This file keeps the generator simple and testable. The original generator
-logic is preserved but expanded to allow deterministic RNG injection.
+Ticket generation and the NumberDrawer live in `game.game` and are
+re-exported here for convenience.
 """
 
-Grid = List[List[Optional[int]]]
-
-
-def _default_col_ranges():
-    return [
-        list(range(1, 10)),        # 1-9
-        list(range(10, 20)),       # 10-19
-        list(range(20, 30)),
-        list(range(30, 40)),
-        list(range(40, 50)),
-        list(range(50, 60)),
-        list(range(60, 70)),
-        list(range(70, 80)),
-        list(range(80, 91)),       # 80-90 inclusive
-    ]
-
-
-def generate_ticket_9x3(rnd: Optional[random.Random] = None, seed: Optional[int] = None) -> Grid:
-    """Generate a single 9x3 UK-style bingo ticket.
-
-    Args:
-        rnd: optional random.Random instance to use (preferred for deterministic sequences).
-        seed: optional int seed (used only if rnd is None).
-
-    Returns:
-        grid: 3x9 nested list, empty cells are None.
-
-    The algorithm follows standard UK constraints:
-    - exactly 15 numbers total
-    - each row has exactly 5 numbers
-    - each column has 1..3 numbers
-    - numbers per column come from fixed ranges
-    - numbers in each column are sorted top-to-bottom
-    """
-    if rnd is None:
-        rnd = random.Random(seed)
-
-    col_ranges = _default_col_ranges()
-
-    TARGET_NUMBERS = 15
-    ROWS = 3
-    COLS = 9
-    MAX_PER_COL = 3
-    MIN_PER_COL = 1
-
-    for attempt in range(1000):
-        counts = [MIN_PER_COL] * COLS
-        remaining = TARGET_NUMBERS - sum(counts)
-
-        for _ in range(remaining):
-            choices = [i for i in range(COLS) if counts[i] < MAX_PER_COL]
-            if not choices:
-                break
-            c = rnd.choice(choices)
-            counts[c] += 1
-
-        if sum(counts) != TARGET_NUMBERS:
-            continue
-
-        try:
-            col_numbers = [sorted(rnd.sample(col_ranges[i], counts[i])) for i in range(COLS)]
-        except ValueError:
-            continue
-
-        capacities = [TARGET_NUMBERS // ROWS] * ROWS  # [5,5,5]
-        grid: Grid = [[None for _ in range(COLS)] for _ in range(ROWS)]
-
-        cols_order = sorted(range(COLS), key=lambda i: -counts[i])
-        placement_failed = False
-
-        for col in cols_order:
-            k = counts[col]
-            available_rows = [r for r in range(ROWS) if capacities[r] > 0]
-            if len(available_rows) < k:
-                placement_failed = True
-                break
-            chosen_rows = rnd.sample(available_rows, k)
-            chosen_rows_sorted = sorted(chosen_rows)
-            nums = col_numbers[col]
-            for row_idx, num in zip(chosen_rows_sorted, nums):
-                grid[row_idx][col] = num
-                capacities[row_idx] -= 1
-
-        if placement_failed:
-            continue
-
-        if all(cap == 0 for cap in capacities):
-            return grid
-
-    raise RuntimeError("Failed to generate a valid bingo ticket after many attempts.")
-
-
-def ticket_numbers_set(grid: Grid) -> FrozenSet[int]:
-    """Return the set of numbers present on a ticket as an immutable key.
-
-    This is used to validate uniqueness across tickets (two tickets are
-    considered identical if they contain the same 15 numbers regardless of position).
-    """
-    nums = {n for row in grid for n in row if n is not None}
-    return frozenset(nums)
-
-
-def generate_unique_tickets(count: int, seed: Optional[int] = None, max_attempts_per_ticket: int = 5000) -> List[Grid]:
-    """Generate `count` unique tickets (unique by number-set) using a single RNG.
-
-    Args:
-        count: number of tickets to generate
-        seed: optional seed for deterministic behavior
-        max_attempts_per_ticket: how many retries to try per ticket before failing
-    Returns:
-        list of unique Grid objects
-    Raises:
-        RuntimeError if unable to produce the required number of unique tickets
-    """
-    if count <= 0:
-        return []
-
-    rnd = random.Random(seed)
-    seen: Set[FrozenSet[int]] = set()
-    tickets: List[Grid] = []
-
-    for i in range(count):
-        attempts = 0
-        while attempts < max_attempts_per_ticket:
-            # pass the RNG so sequences are deterministic and reproducible
-            ticket = generate_ticket_9x3(rnd=rnd)
-            key = ticket_numbers_set(ticket)
-            if len(key) != 15:
-                # sanity guard: regenerate if ticket malformed
-                attempts += 1
-                continue
-            if key not in seen:
-                seen.add(key)
-                tickets.append(ticket)
-                break
-            attempts += 1
-
-        if attempts >= max_attempts_per_ticket:
-            raise RuntimeError(f"Failed to generate a unique ticket #{i+1} after {attempts} attempts")
-
-    return tickets
-
-
-def print_ticket(grid: Grid, drawn: Optional[Set[int]] = None, show_cols_header: bool = True) -> None:
+__all__ = [
+    # defined here
+    "ALREADY_MARKED",
+    "MARKED",
+    "NOT_ON_TICKET",
+    "GameRound",
+    "StateDelta",
+    "check_line_complete",
+    "main",
+    "play_interactive_demo",
+    "print_ticket",
+    "validate_bingo_claim",
+    "validate_line_claim",
+    # re-exported from game.game
+    "AnyGrid",
+    "Drawn",
+    "FlatGrid",
+    "Grid",
+    "NumberDrawer",
+    "Ticket",
+    "check_bingo_complete",
+    "drawn_lookup",
+    "flat_cells_drawn",
+    "flatten_grid",
+    "generate_ticket_9x3",
+    "generate_unique_tickets",
+    "grid_rows",
+    "new_drawn_bitmap",
+    "release_grid",
+    "ticket_numbers_set",
+]
+
+
+def print_ticket(grid: AnyGrid, drawn: Optional[Set[int]] = None, show_cols_header: bool = True) -> None:
     """Render a single 3x9 ticket clearly in the terminal.
 
-    If `drawn` is provided (set of ints) drawn numbers are marked with a leading
-    '*' so the player can see which numbers have been called.
+    `grid` may be a nested Grid or a FlatGrid. If `drawn` is provided (set of
+    ints) drawn numbers are marked with a leading '*' so the player can see
+    which numbers have been called.
     """
     COLS = 9
     if drawn is None:
@@ -170,10 +84,10 @@ def print_ticket(grid: Grid, drawn: Optional[Set[int]] = None, show_cols_header:
         print(headers)
     # top border
     print("+" + "----" * COLS + "+")
-    for row in grid:
+    for row in grid_rows(grid):
         row_str = "|"
         for cell in row:
-            if cell is None:
+            if not cell:
                 row_str += "   |"
             else:
                 if cell in drawn:
@@ -186,214 +100,306 @@ def print_ticket(grid: Grid, drawn: Optional[Set[int]] = None, show_cols_header:
     print("+" + "----" * COLS + "+")
 
 
-def check_line_complete(grid: Grid, drawn: Set[int]) -> Optional[int]:
+def check_line_complete(grid: Union[AnyGrid, Ticket], drawn: Drawn) -> Optional[int]:
     """Check whether any single row (line) on `grid` is complete with respect to `drawn`.
 
-    Returns the row index (0..2) of the first complete line found, or None if none.
+    `grid` may be a Grid, a FlatGrid or a `Ticket`, whose precomputed `row_nums`
+    skip the empty-cell filtering; `drawn` any container of drawn numbers or a
+    `DrawnBitmap`. Returns the row index (0..2) of the first complete line
+    found, or None if none.
     """
-    for r, row in enumerate(grid):
-        all_drawn = True
-        for cell in row:
-            if cell is None:
-                continue
-            if cell not in drawn:
-                all_drawn = False
-                break
-        if all_drawn:
+    cells = grid.grid if isinstance(grid, Ticket) else grid
+    if isinstance(drawn, bytearray) and isinstance(cells, bytearray):
+        for r in range(3):
+            if flat_cells_drawn(cells[r * 9:(r + 1) * 9], drawn):
+                return r
+        return None
+    if isinstance(grid, Ticket):
+        rows = grid.row_nums
+    else:
+        # numbers start at 1, so filter(None, ...) only drops the empty cells
+        rows = (filter(None, row) for row in grid_rows(grid))
+    if isinstance(drawn, (set, frozenset)):
+        for r, row in enumerate(rows):
+            # issuperset walks `row` in C and stops at the first undrawn number
+            if drawn.issuperset(row):
+                return r
+        return None
+    # any other container (DrawnBitmap, or a tuple/list such as
+    # NumberDrawer.drawn()) is probed one number at a time
+    lookup = drawn_lookup(drawn)
+    for r, row in enumerate(rows):
+        if all(map(lookup, row)):
             return r
     return None
 
 
-def validate_line_claim(grid: Grid, drawn: Set[int]) -> bool:
+def validate_line_claim(grid: Union[AnyGrid, Ticket], drawn: Drawn) -> bool:
     """Validate a player's claim for a line. Returns True if a line is complete."""
     return check_line_complete(grid, drawn) is not None
 
 
-def check_bingo_complete(grid: Grid, drawn: Set[int]) -> bool:
-    """Return True if all numbers on `grid` are present in `drawn` (full ticket)."""
-    for row in grid:
-        for cell in row:
-            if cell is None:
-                continue
-            if cell not in drawn:
-                return False
-    return True
-
-
-def validate_bingo_claim(grid: Grid, drawn: Set[int]) -> bool:
+def validate_bingo_claim(grid: Union[AnyGrid, Ticket], drawn: Drawn) -> bool:
     """Validate a player's Bingo claim (full ticket)."""
     return check_bingo_complete(grid, drawn)
 
 
-def play_interactive_demo():
-    """Interactive demo to buy one ticket, draw numbers, and allow manual line claims.
+# `num_to_row` entry for numbers that are not on the ticket
+_NO_ROW = 0xFF
+
+
+def _new_player(cells: FlatGrid) -> Dict[str, Any]:
+    """Bundle a flattened ticket with the lookups the draw loop needs.
 
-    Assumptions made:
-    - Ticket cost is $1.
-    - Valid line prize is $5.
-    - Player starts with $10 by default (prompted).
-    These choices are small, reasonable defaults for a demo and can be changed.
+    `num_to_row` is a 91-byte table giving each number's row (or `_NO_ROW`),
+    so one index both tests membership and finds the row. `row_remaining`
+    counts the unmarked numbers per row, so marking a number and testing for
+    a line or bingo are O(1) instead of grid scans.
     """
-    TICKET_COST = 1
-    LINE_PRIZE = 5
-    DEFAULT_WALLET = 10
+    num_to_row = bytearray(b"\xff" * 91)
+    for i, n in enumerate(cells):
+        if n:
+            num_to_row[n] = i // 9
+    return {
+        "cells": cells,
+        "num_to_row": num_to_row,
+        "row_remaining": [9 - cells[r * 9:(r + 1) * 9].count(0) for r in range(3)],
+        "marks": set(),
+    }
 
-    try:
-        inp = input(f"Enter starting wallet amount (default {DEFAULT_WALLET}): ")
-        wallet = int(inp) if inp.strip() else DEFAULT_WALLET
-    except Exception:
-        wallet = DEFAULT_WALLET
-
-    print(f"You have ${wallet}. Each ticket costs ${TICKET_COST}.")
-    if wallet < TICKET_COST:
-        print("Insufficient funds to buy a ticket. Exiting demo.")
-        return
-
-    # Endless mode: keep playing rounds until the user explicitly exits with 'e'
-    session_active = True
-    while session_active:
-        # Ensure the player can buy a ticket for this round
-        if wallet < TICKET_COST:
-            print("Insufficient funds to buy a ticket for the next round.")
-            resp = input("Press 'e' to exit or press Enter to deposit and continue: ").strip().lower()
-            if resp == 'e':
-                break
-            try:
-                dep = int(input("Enter deposit amount: "))
-                if dep > 0:
-                    wallet += dep
-                    print(f"Deposited ${dep}. Wallet: ${wallet}")
-                else:
-                    print("No deposit made.")
-            except Exception:
-                print("Invalid deposit. Exiting.")
-                break
-            if wallet < TICKET_COST:
-                print("Still insufficient funds. Exiting.")
-                break
 
-        wallet -= TICKET_COST
-        print(f"Bought 1 ticket for ${TICKET_COST}. Remaining wallet: ${wallet}\n")
+def _complete_line(player: Dict[str, Any]) -> Optional[int]:
+    """Return the index of the first fully marked row, or None."""
+    row_remaining = player["row_remaining"]
+    return row_remaining.index(0) if 0 in row_remaining else None
 
-        # Generate two unique tickets: one for the player and one for the bot
-        tickets = generate_unique_tickets(2)
-        player_ticket = tickets[0]
-        bot_ticket = tickets[1]
 
-        drawer = NumberDrawer()
-        drawn_set: Set[int] = set()
-        # player's manually marked numbers (player must confirm each draw)
-        player_marked_set: Set[int] = set()
+def _has_bingo(player: Dict[str, Any]) -> bool:
+    return sum(player["row_remaining"]) == 0
 
-        # Track who (if anyone) has claimed the line or bingo for this round
-        line_claimed_by: Optional[str] = None  # 'player' | 'bot' | None
-        bingo_claimed_by: Optional[str] = None
 
-        print("Your ticket:")
-        # show player's own marked numbers (initially none)
-        print_ticket(player_ticket, drawn=player_marked_set)
-        print("(Bot has its own ticket.)")
+# Results of GameRound.mark
+MARKED = "marked"
+ALREADY_MARKED = "already_marked"
+NOT_ON_TICKET = "not_on_ticket"
 
-        print("\nControls: press Enter to draw next number, 'l' to attempt to claim Line, 'b' to attempt to claim Bingo")
 
-        round_active = True
-        while round_active:
-            try:
-                n = drawer.draw_next()
-            except StopIteration:
-                print("No more numbers to draw for this round.")
-                break
-            drawn_set.add(n)
-            print(f"\nNumber drawn: {n}")
-            #print("Draw history:", drawer.drawn())
-
-            # Ask player to manually confirm and mark the number on their ticket
-            while True:
-                mark_resp = input(f"Do you have {n} on your ticket? (y/n): ").strip().lower()
-                if mark_resp in ("y", "n", ""):
-                    break
-                print("Please answer 'y' or 'n'.")
+class StateDelta(NamedTuple):
+    """Round state after a draw, as reported by `GameRound.check_state`."""
+
+    bot_line: Optional[int]  # row the bot just completed and claimed, if any
+    player_bingo: bool
+    bot_bingo: bool
+
+
+class GameRound:
+    """Game state for one round between the player and the bot.
+
+    Nothing here does I/O, so rounds can be simulated headlessly (tests,
+    bot-vs-bot benchmarks); `play_interactive_demo` is a thin input()/print()
+    wrapper around it. The bot marks every drawn number on its ticket, the
+    player only the numbers passed to `mark`.
+    """
+
+    def __init__(self, player_cells: FlatGrid, bot_cells: FlatGrid):
+        self.player = _new_player(player_cells)
+        self.bot = _new_player(bot_cells)
+        self.line_claimed_by: Optional[str] = None  # 'player' | 'bot' | None
+        self.bingo_claimed_by: Optional[str] = None
+
+    @classmethod
+    def deal(cls, seed: Optional[int] = None) -> "GameRound":
+        """Start a round with two unique tickets: the player's and the bot's."""
+        grids = generate_unique_tickets(2, seed)
+        game_round = cls(flatten_grid(grids[0]), flatten_grid(grids[1]))
+        # the nested grids are no longer needed; recycle them for the next round
+        for grid in grids:
+            release_grid(grid)
+        return game_round
+
+    @property
+    def player_marks(self) -> Set[int]:
+        return self.player["marks"]
+
+    def draw(self, n: int) -> None:
+        """Record that `n` was drawn; the bot marks it if it is on its ticket."""
+        row = self.bot["num_to_row"][n]
+        if row != _NO_ROW:
+            self.bot["row_remaining"][row] -= 1
+
+    def mark(self, n: int) -> str:
+        """Mark `n` on the player's ticket. Returns MARKED, ALREADY_MARKED or NOT_ON_TICKET."""
+        row = self.player["num_to_row"][n]
+        if row == _NO_ROW:
+            return NOT_ON_TICKET
+        if n in self.player["marks"]:
+            return ALREADY_MARKED
+        self.player["marks"].add(n)
+        self.player["row_remaining"][row] -= 1
+        return MARKED
+
+    def check_state(self) -> StateDelta:
+        """Let the bot claim a completed line if nobody has yet and report bingo status."""
+        bot_line = _complete_line(self.bot)
+        if bot_line is not None and self.line_claimed_by is None:
+            self.line_claimed_by = 'bot'
+        else:
+            bot_line = None
+        return StateDelta(bot_line, _has_bingo(self.player), _has_bingo(self.bot))
+
+    def claim_line(self) -> bool:
+        """Player's line claim. Records it and returns True if the line is unclaimed and complete."""
+        if self.line_claimed_by is None and _complete_line(self.player) is not None:
+            self.line_claimed_by = 'player'
+            return True
+        return False
+
+    def claim_bingo(self) -> bool:
+        """Player's bingo claim. Records it and returns True if bingo is unclaimed and complete."""
+        if self.bingo_claimed_by is None and _has_bingo(self.player):
+            self.bingo_claimed_by = 'player'
+            return True
+        return False
+
+    def settle_bingo(self, state: StateDelta) -> Optional[str]:
+        """Award an automatic bingo from `state` (the bot wins ties).
+
+        Returns 'bot' or 'player' if bingo was decided by this call, else None.
+        """
+        if self.bingo_claimed_by is not None:
+            return None
+        if state.bot_bingo:
+            self.bingo_claimed_by = 'bot'
+        elif state.player_bingo:
+            self.bingo_claimed_by = 'player'
+        return self.bingo_claimed_by
+
+
+def play_interactive_demo(balance: Optional[BalanceManager] = None, verbose: bool = True):
+    """Interactive demo to buy one ticket, draw numbers, and allow manual line claims.
 
-            if mark_resp == "y":
-                # validate and mark if correct, else show error
-                if n in ticket_numbers_set(player_ticket):
-                    if n in player_marked_set:
-                        print("That number is already marked on your ticket.")
+    Prices come from `balance` (a default `BalanceManager` when omitted: $1
+    tickets, a $5 line prize, a bingo prize of 4x the line prize and a $10
+    starting wallet), so the messages always match what is charged or paid.
+
+    Balance changes are buffered in memory and flushed to disk at the end of
+    every round and when the demo returns or is interrupted. With
+    `verbose=False` the per-draw output (drawn number, mark feedback, ticket
+    render) is skipped.
+    """
+    if balance is None:
+        balance = BalanceManager()
+    try:
+        wallet = balance.get_balance()
+        print(f"You have ${wallet}. Each ticket costs ${balance.ticket_cost}.")
+        if not balance.can_afford_ticket():
+            print("Insufficient funds to buy a ticket. Exiting demo.")
+            return
+
+        # Endless mode: keep playing rounds until the user explicitly exits with 'e'
+        session_active = True
+        while session_active:
+            # Ensure the player can buy a ticket for this round
+            if not balance.can_afford_ticket():
+                print("Insufficient funds to buy a ticket for the next round.")
+                resp = input("Press 'e' to exit or press Enter to deposit and continue: ").strip().lower()
+                if resp == 'e':
+                    break
+                try:
+                    dep = int(input("Enter deposit amount: "))
+                    if dep > 0:
+                        wallet = balance.deposit(dep)
+                        print(f"Deposited ${dep}. Wallet: ${wallet}")
                     else:
-                        player_marked_set.add(n)
-                        print(f"Marked {n} on your ticket.")
-                else:
-                    print("Error: that number is not on your ticket. No mark applied.")
-            # show player's ticket with their own marks
-            print_ticket(player_ticket, drawn=player_marked_set)
-
-            # Check for line completion for both players: player uses their marked set, bot uses drawn_set
-            player_line = check_line_complete(player_ticket, player_marked_set)
-            bot_line = check_line_complete(bot_ticket, drawn_set)
-
-            # If the bot completes a line and no one has claimed it yet, bot claims immediately
-            if bot_line is not None and line_claimed_by is None:
-                line_claimed_by = 'bot'
-                print(f"Bot completed a LINE (row {bot_line}) and claims the ${LINE_PRIZE} line prize!")
-
-            # If player attempts to claim line via input it will be validated against the current state
-            resp = input("Claim? (Enter=continue, l=claim Line, b=claim Bingo): ").strip().lower()
-            if resp == "l":
-                # Only allow claim if no one has already claimed the line
-                if line_claimed_by is not None:
-                    print(f"Line already claimed by {line_claimed_by}. No prize for you.")
-                    continue
+                        print("No deposit made.")
+                except Exception:
+                    print("Invalid deposit. Exiting.")
+                    break
+                if not balance.can_afford_ticket():
+                    print("Still insufficient funds. Exiting.")
+                    break
 
-                valid = validate_line_claim(player_ticket, player_marked_set)
-                if valid:
-                    line_claimed_by = 'player'
-                    wallet += LINE_PRIZE
-                    print(f"Valid LINE! You win ${LINE_PRIZE}. Wallet: ${wallet}\n")
-                else:
-                    print("Invalid claim — that is not a complete line. No prize awarded.")
-                continue
-
-            # Automatic bingo check: if either has bingo, award and end round
-            player_bingo = check_bingo_complete(player_ticket, player_marked_set)
-            bot_bingo = check_bingo_complete(bot_ticket, drawn_set)
-            if player_bingo or bot_bingo:
-                BINGO_PRIZE = LINE_PRIZE * 4
-
-                # If bot has bingo and no one has claimed yet, bot wins immediately
-                if bot_bingo and bingo_claimed_by is None:
-                    bingo_claimed_by = 'bot'
-                    print(f"Bot has BINGO and wins the ${BINGO_PRIZE} prize. You lose this round.")
-                # Else if player has bingo and no one has claimed yet, player wins
-                elif player_bingo and bingo_claimed_by is None:
-                    bingo_claimed_by = 'player'
-                    wallet += BINGO_PRIZE
-                    print(f"You have BINGO! You win ${BINGO_PRIZE}. Wallet: ${wallet}")
-
-                # After bingo, prompt for endless mode controls
+            wallet = balance.spend_for_tickets()
+            print(f"Bought 1 ticket for ${balance.ticket_cost}. Remaining wallet: ${wallet}\n")
+
+            # Generate two unique tickets: one for the player and one for the bot
+            game_round = GameRound.deal()
+            drawer = NumberDrawer()
+            # player's manually marked numbers (player must confirm each draw)
+            player_marked_set = game_round.player_marks
+
+            print("Your ticket:")
+            # show player's own marked numbers (initially none)
+            print_ticket(game_round.player["cells"], drawn=player_marked_set)
+            print("(Bot has its own ticket.)")
+
+            print("\nControls: press Enter to draw next number, 'l' to attempt to claim Line, 'b' to attempt to claim Bingo")
+
+            round_active = True
+            while round_active:
+                try:
+                    n = drawer.draw_next()
+                except StopIteration:
+                    print("No more numbers to draw for this round.")
+                    break
+                game_round.draw(n)
+                if verbose:
+                    print(f"\nNumber drawn: {n}")
+                #print("Draw history:", drawer.drawn())
+
+                # Ask player to manually confirm and mark the number on their ticket
                 while True:
-                    choice = input("Press 'e' to end this game, or 'r' to repeat again: ").strip().lower()
-                    if choice == 'e':
-                        session_active = False
-                        round_active = False
-                        break
-                    if choice == 'r':
-                        round_active = False
+                    mark_resp = input(f"Do you have {n} on your ticket? (y/n): ").strip().lower()
+                    if mark_resp in ("y", "n", ""):
                         break
-                    print("Invalid choice. Press 'e' or 'r'.")
-                break
-            if resp == "b":
-                # Only allow player's bingo claim if nobody has already claimed bingo
-                if bingo_claimed_by is not None:
-                    print(f"Bingo already claimed by {bingo_claimed_by}. No prize for you.")
+                    print("Please answer 'y' or 'n'.")
+
+                if mark_resp == "y":
+                    # validate and mark if correct, else show error
+                    result = game_round.mark(n)
+                    if verbose:
+                        if result == ALREADY_MARKED:
+                            print("That number is already marked on your ticket.")
+                        elif result == MARKED:
+                            print(f"Marked {n} on your ticket.")
+                        else:
+                            print("Error: that number is not on your ticket. No mark applied.")
+                # show player's ticket with their own marks
+                if verbose:
+                    print_ticket(game_round.player["cells"], drawn=player_marked_set)
+
+                # If the bot completes a line and no one has claimed it yet, bot claims immediately
+                state = game_round.check_state()
+                if state.bot_line is not None:
+                    print(f"Bot completed a LINE (row {state.bot_line}) and claims the ${balance.line_prize} line prize!")
+
+                # If player attempts to claim line via input it will be validated against the current state
+                resp = input("Claim? (Enter=continue, l=claim Line, b=claim Bingo): ").strip().lower()
+                if resp == "l":
+                    # Only allow claim if no one has already claimed the line
+                    if game_round.line_claimed_by is not None:
+                        print(f"Line already claimed by {game_round.line_claimed_by}. No prize for you.")
+                        continue
+
+                    if game_round.claim_line():
+                        wallet = balance.award_line()
+                        print(f"Valid LINE! You win ${balance.line_prize}. Wallet: ${wallet}\n")
+                    else:
+                        print("Invalid claim — that is not a complete line. No prize awarded.")
                     continue
 
-                valid_bingo = validate_bingo_claim(player_ticket, player_marked_set)
-                if valid_bingo:
-                    bingo_claimed_by = 'player'
-                    BINGO_PRIZE = LINE_PRIZE * 4
-                    wallet += BINGO_PRIZE
-                    print(f"Valid BINGO! You win ${BINGO_PRIZE}. Wallet: ${wallet}")
-                    # Prompt for endless controls
+                # Automatic bingo check: if either has bingo, award and end round
+                if state.player_bingo or state.bot_bingo:
+                    winner = game_round.settle_bingo(state)
+                    # If bot has bingo and no one has claimed yet, bot wins immediately
+                    if winner == 'bot':
+                        print(f"Bot has BINGO and wins the ${balance.bingo_prize} prize. You lose this round.")
+                    # Else if player has bingo and no one has claimed yet, player wins
+                    elif winner == 'player':
+                        wallet = balance.award_bingo()
+                        print(f"You have BINGO! You win ${balance.bingo_prize}. Wallet: ${wallet}")
+
+                    # After bingo, prompt for endless mode controls
                     while True:
                         choice = input("Press 'e' to end this game, or 'r' to repeat again: ").strip().lower()
                         if choice == 'e':
@@ -405,58 +411,60 @@ def play_interactive_demo():
                             break
                         print("Invalid choice. Press 'e' or 'r'.")
                     break
-                else:
-                    print("Invalid Bingo claim — not all numbers are drawn yet.")
-                    continue
-            # otherwise (Enter) just continue to next draw
-
-        # round finished (either by bingo and choice, or by deck exhaustion)
-        if not session_active:
-            break
-
-    print(f"Session finished. Final wallet: ${wallet}")
-
-
-class NumberDrawer:
-    """Simple drawer for numbers 1 to 90 with no duplicates.
-
-    Usage:
-        d = NumberDrawer(seed=42)
-        n = d.draw_next()
-        history = d.drawn()
-        remaining = d.remaining_count()
-    """
-
-    def __init__(self, seed: Optional[int] = None):
-        self._seed = seed
-        self.reset(seed)
+                if resp == "b":
+                    # Only allow player's bingo claim if nobody has already claimed bingo
+                    if game_round.bingo_claimed_by is not None:
+                        print(f"Bingo already claimed by {game_round.bingo_claimed_by}. No prize for you.")
+                        continue
+
+                    if game_round.claim_bingo():
+                        wallet = balance.award_bingo()
+                        print(f"Valid BINGO! You win ${balance.bingo_prize}. Wallet: ${wallet}")
+                        # Prompt for endless controls
+                        while True:
+                            choice = input("Press 'e' to end this game, or 'r' to repeat again: ").strip().lower()
+                            if choice == 'e':
+                                session_active = False
+                                round_active = False
+                                break
+                            if choice == 'r':
+                                round_active = False
+                                break
+                            print("Invalid choice. Press 'e' or 'r'.")
+                        break
+                    else:
+                        print("Invalid Bingo claim — not all numbers are drawn yet.")
+                        continue
+                # otherwise (Enter) just continue to next draw
 
-    def reset(self, seed: Optional[int] = None) -> None:
-        if seed is None:
-            seed = self._seed
-        self._rnd = random.Random(seed)
-        self._pool = list(range(1, 91))
-        self._rnd.shuffle(self._pool)
-        self._drawn: List[int] = []
+            # round finished (either by bingo and choice, or by deck exhaustion)
+            balance.flush()
+            if not session_active:
+                break
 
-    def draw_next(self) -> int:
-        """Draw the next number. Raises StopIteration when pool exhausted."""
-        if not self._pool:
-            raise StopIteration("All numbers have been drawn")
-        n = self._pool.pop(0)
-        self._drawn.append(n)
-        return n
+        print(f"Session finished. Final wallet: ${wallet}")
+    finally:
+        # also covers leaving mid-round (Ctrl-C, closed stdin)
+        balance.flush()
 
-    def drawn(self) -> List[int]:
-        return list(self._drawn)
 
-    def remaining(self) -> List[int]:
-        return list(self._pool)
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Command-line entrypoint: optionally reset the wallet, then run the demo."""
+    parser = argparse.ArgumentParser(description="Terminal 90-ball bingo demo.")
+    parser.add_argument(
+        "--reset-wallet",
+        action="store_true",
+        help="reset the persisted wallet to the starting balance before playing",
+    )
+    args = parser.parse_args(argv)
 
-    def remaining_count(self) -> int:
-        return len(self._pool)
+    # constructed only after argument parsing so `--help` never touches disk
+    balance = BalanceManager()
+    if args.reset_wallet:
+        print(f"Wallet reset to ${balance.reset()}.")
+    play_interactive_demo(balance)
 
 
 if __name__ == "__main__":
     # run interactive demo that demonstrates buying a ticket, drawing and claiming a line
-    play_interactive_demo()
+    main()
@@ -0,0 +1,60 @@
+import sys
+import pathlib
+
+# Ensure 'src' (package root) is on sys.path so we can import package modules
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from game.economy import BalanceManager
+
+
+def test_balance_changes_are_buffered_until_flush(tmp_path):
+    storage = tmp_path / "wallet.json"
+    manager = BalanceManager(storage_path=storage, starting_balance=10)
+
+    manager.spend_for_tickets()
+    manager.award_line()
+    assert manager.get_balance() == 14
+    # nothing hits the disk before the checkpoint
+    assert not storage.exists()
+
+    manager.flush()
+    assert BalanceManager(storage_path=storage).get_balance() == 14
+
+
+def test_flush_threshold_and_reset_persist_immediately(tmp_path):
+    storage = tmp_path / "wallet.json"
+    manager = BalanceManager(storage_path=storage, starting_balance=10, flush_threshold=3)
+
+    manager.deposit(1)
+    manager.deposit(1)
+    assert not storage.exists()
+    manager.deposit(1)
+    assert BalanceManager(storage_path=storage).get_balance() == 13
+
+    manager.adjust_balance(5)
+    manager.reset()
+    assert BalanceManager(storage_path=storage, starting_balance=0).get_balance() == 10
+
+
+def test_write_is_atomic_and_leaves_no_temp_file(tmp_path):
+    storage = tmp_path / "nested" / "wallet.json"
+    manager = BalanceManager(storage_path=storage, starting_balance=10)
+    manager.set_balance(42)
+
+    assert storage.read_text() == '{"balance":42}'
+    assert sorted(p.name for p in storage.parent.iterdir()) == ["wallet.json"]
+
+
+def test_reload_picks_up_external_wallet_changes(tmp_path):
+    storage = tmp_path / "wallet.json"
+    BalanceManager(storage_path=storage).set_balance(7)
+    assert BalanceManager(storage_path=storage).get_balance() == 7
+
+    # an edit from outside the process invalidates the cached parse
+    storage.write_text('{\n  "balance": 123\n}')
+    assert BalanceManager(storage_path=storage).get_balance() == 123
+
+    storage.write_text("not json")
+    assert BalanceManager(storage_path=storage, starting_balance=3).get_balance() == 3
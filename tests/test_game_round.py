@@ -0,0 +1,110 @@
+import sys
+import pathlib
+
+# Ensure 'src' (package root) is on sys.path so we can import package modules
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from game import main as main_module
+
+
+def _numbers(cells):
+    return [n for n in cells if n]
+
+
+def test_bot_claims_line_then_bingo_headlessly():
+    game_round = main_module.GameRound.deal(seed=8)
+    bot_nums = _numbers(game_round.bot["cells"])
+
+    lines = []
+    for n in bot_nums:
+        game_round.draw(n)
+        state = game_round.check_state()
+        if state.bot_line is not None:
+            lines.append(state.bot_line)
+
+    # the line is claimed exactly once, and bingo lands on the last number
+    assert len(lines) == 1
+    assert game_round.line_claimed_by == "bot"
+    assert state.bot_bingo
+    assert game_round.settle_bingo(state) == "bot"
+    assert game_round.settle_bingo(state) is None
+    assert not game_round.claim_bingo()
+
+
+def test_player_marks_and_claims():
+    game_round = main_module.GameRound.deal(seed=9)
+    player_nums = _numbers(game_round.player["cells"])
+    off_ticket = next(n for n in range(1, 91) if n not in player_nums)
+
+    assert game_round.mark(off_ticket) == main_module.NOT_ON_TICKET
+    assert not game_round.claim_line()
+
+    first_row = [n for n in game_round.player["cells"][:9] if n]
+    for n in first_row:
+        game_round.draw(n)
+        assert game_round.mark(n) == main_module.MARKED
+    assert game_round.mark(first_row[0]) == main_module.ALREADY_MARKED
+    assert game_round.claim_line()
+    assert game_round.line_claimed_by == "player"
+    assert not game_round.claim_bingo()
+
+
+def test_line_claims_accept_grids_and_tickets():
+    grid = main_module.generate_ticket_9x3(seed=10)
+    ticket = main_module.Ticket.from_grid(grid)
+    assert all(len(row) == 5 for row in ticket.row_nums)
+    assert ticket.all_nums == main_module.ticket_numbers_set(grid)
+    assert ticket.nums == tuple(sorted(ticket.all_nums))
+    assert main_module.ticket_numbers_set(ticket) is ticket.all_nums
+    # tickets wrap a mutable grid, so they hash and compare by identity
+    assert len({ticket, main_module.Ticket.from_grid(grid)}) == 2
+
+    drawn = set(ticket.row_nums[2])
+    flat = main_module.flatten_grid(grid)
+    for form in (grid, flat, ticket, main_module.Ticket.from_grid(flat)):
+        assert main_module.check_line_complete(form, drawn) == 2
+        assert main_module.check_line_complete(form, drawn - {ticket.row_nums[2][0]}) is None
+        assert main_module.validate_line_claim(form, drawn)
+        assert not main_module.validate_bingo_claim(form, drawn)
+        assert main_module.validate_bingo_claim(form, set(ticket.all_nums))
+
+        # plain sequences such as NumberDrawer.drawn() work too
+        assert main_module.check_line_complete(form, tuple(drawn)) == 2
+        assert main_module.check_line_complete(form, list(drawn)) == 2
+        assert not main_module.validate_bingo_claim(form, tuple(drawn))
+        assert main_module.validate_bingo_claim(form, list(ticket.nums))
+
+        # the preset table, a bare 256-byte table and a 91-byte table indexed
+        # by number must all give the same answers
+        for bitmap in (main_module.new_drawn_bitmap(), bytearray(256), bytearray(91)):
+            for n in drawn:
+                bitmap[n] = 1
+            assert main_module.check_line_complete(form, bitmap) == 2
+            assert not main_module.validate_bingo_claim(form, bitmap)
+            for n in ticket.nums:
+                bitmap[n] = 1
+            assert main_module.validate_bingo_claim(form, bitmap)
+
+
+def test_demo_reports_the_balance_managers_prices(tmp_path, monkeypatch, capsys):
+    from game.economy import BalanceManager
+
+    balance = BalanceManager(storage_path=tmp_path / "wallet.json", ticket_cost=2, line_prize=3)
+    def answer(prompt=""):
+        # never mark or claim: the bot wins the round, then end the session
+        if "(y/n)" in prompt:
+            return "n"
+        if "Claim?" in prompt:
+            return ""
+        return "e"
+
+    monkeypatch.setattr("builtins.input", answer)
+    main_module.play_interactive_demo(balance, verbose=False)
+
+    out = capsys.readouterr().out
+    assert "Each ticket costs $2." in out
+    assert "Bought 1 ticket for $2. Remaining wallet: $8" in out
+    assert "claims the $3 line prize" in out
+    assert "wins the $12 prize" in out
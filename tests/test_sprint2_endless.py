@@ -1,6 +1,9 @@
+import random
 import sys
 import pathlib
 
+import pytest
+
 # Ensure 'src' (package root) is on sys.path so we can import package modules
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
@@ -11,6 +14,8 @@ from game.economy import BalanceManager
 
 
 def _flatten_ticket_nums(ticket):
+    if isinstance(ticket, game_module.Ticket):
+        return list(ticket.nums)
     return [n for row in ticket for n in row if n is not None]
 
 
@@ -43,17 +48,19 @@ def test_endless_mode_simulation_persistent_balance(tmp_path):
         drawer._pool = ticket_nums + rest
         drawer._drawn = []
 
-        drawn_set = set()
+        tracker = game_module.TicketTracker([ticket])
         # draw until bingo
         while True:
             n = drawer.draw_next()
-            drawn_set.add(n)
-            if game_module.check_bingo_complete(ticket, drawn_set):
+            if tracker.draw(n):
                 # award bingo
                 manager.award_bingo()
                 expected_balance += manager.bingo_prize
                 break
 
+        # round end checkpoint persists the buffered balance
+        manager.flush()
+
     # reload manager to ensure persistence
     reloaded = BalanceManager(storage_path=storage, starting_balance=1, ticket_cost=ticket_cost)
     assert reloaded.get_balance() == expected_balance
@@ -62,7 +69,7 @@ def test_endless_mode_simulation_persistent_balance(tmp_path):
 def test_drawer_and_ticket_quick_bingo():
     # Generate ticket and ensure that when drawer pool starts with ticket numbers,
     # bingo occurs within exactly len(ticket_numbers) draws
-    ticket = game_module.generate_unique_tickets(1, seed=42)[0]
+    ticket = game_module.Ticket.from_grid(game_module.generate_unique_tickets(1, seed=42)[0])
     ticket_nums = _flatten_ticket_nums(ticket)
 
     drawer = game_module.NumberDrawer()
@@ -80,3 +87,91 @@ def test_drawer_and_ticket_quick_bingo():
             break
 
     assert draws <= len(ticket_nums)
+
+
+def test_drawer_draws_every_number_once():
+    drawer = game_module.NumberDrawer()
+    seen = [drawer.draw_next() for _ in range(90)]
+
+    assert sorted(seen) == list(range(1, 91))
+    assert drawer.drawn() == tuple(seen)
+    assert drawer.remaining() == ()
+    assert drawer.remaining_count() == 0
+    with pytest.raises(StopIteration):
+        drawer.draw_next()
+
+
+def test_ticket_tracker_matches_full_rescans():
+    tickets = game_module.generate_unique_tickets(4, seed=77)
+    tracker = game_module.TicketTracker(tickets)
+    drawer = game_module.NumberDrawer(seed=3)
+
+    drawn_set = set()
+    drawn_bitmap = game_module.new_drawn_bitmap()
+    done = set()
+    for _ in range(90):
+        n = drawer.draw_next()
+        drawn_set.add(n)
+        drawn_bitmap[n] = 1
+        completed = tracker.draw(n)
+        assert completed == [tid for tid in range(4) if tid not in done and tracker.bingo_complete(tid)]
+        done.update(completed)
+        for tid, ticket in enumerate(tickets):
+            assert tracker.bingo_complete(tid) == game_module.check_bingo_complete(ticket, drawn_set)
+            assert tracker.bingo_complete(tid) == game_module.check_bingo_complete(ticket, drawn_bitmap)
+            flat = game_module.flatten_grid(ticket)
+            assert tracker.bingo_complete(tid) == game_module.check_bingo_complete(flat, drawn_bitmap)
+            line = tracker.line_complete(tid)
+            if line is not None:
+                assert all(v is None or v in drawn_set for v in ticket[line])
+    assert done == {0, 1, 2, 3}
+
+
+def test_assigning_pool_restarts_the_draw_order():
+    drawer = game_module.NumberDrawer(seed=5)
+    drawer.draw_next()
+    drawer.draw_next()
+    drawer._pool = [7, 8, 9]
+    assert drawer.remaining_count() == 3
+    assert [drawer.draw_next() for _ in range(3)] == [7, 8, 9]
+    with pytest.raises(StopIteration):
+        drawer.draw_next()
+
+
+def test_drawn_history_follows_a_replaced_history():
+    drawer = game_module.NumberDrawer(seed=5)
+    drawer.draw_next()
+    drawer.draw_next()
+    assert len(drawer.drawn()) == 2
+
+    drawer._pool = [7, 8, 9]
+    drawer._drawn = []
+    assert drawer.drawn() == ()
+    drawer.draw_next()
+    drawer.draw_next()
+    assert drawer.drawn() == (7, 8)
+    assert drawer.remaining() == (9,)
+
+    # clearing the live history in place is supported as well
+    drawer._pool = [4, 5]
+    drawer._drawn.clear()
+    drawer.draw_next()
+    assert drawer.drawn() == (4,)
+
+
+def test_drawer_accepts_rnd_or_seed_positionally():
+    by_rnd = game_module.NumberDrawer(random.Random(1))
+    by_rnd_kw = game_module.NumberDrawer(rnd=random.Random(1))
+    assert [by_rnd.draw_next() for _ in range(10)] == [by_rnd_kw.draw_next() for _ in range(10)]
+
+    by_seed = game_module.NumberDrawer(42)
+    by_seed_kw = game_module.NumberDrawer(seed=42)
+    assert by_seed.seed == 42 and by_seed.rnd is None
+    assert [by_seed.draw_next() for _ in range(10)] == [by_seed_kw.draw_next() for _ in range(10)]
+
+
+def test_drawers_compare_and_hash_by_identity():
+    a = game_module.NumberDrawer(seed=1)
+    b = game_module.NumberDrawer(seed=1)
+    assert a != b
+    assert len({a, b}) == 2
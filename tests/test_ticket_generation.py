@@ -85,3 +85,92 @@ def test_generate_unique_tickets_deterministic_and_zero():
 
     # zero count returns empty list
     assert ticket_module.generate_unique_tickets(0) == []
+
+
+def test_seeded_ticket_cache_returns_fresh_copies():
+    ticket_module._TICKET_CACHE.clear()
+    fresh = ticket_module.generate_unique_tickets(3, seed=321)
+    cached = ticket_module.generate_unique_tickets(3, seed=321)
+    assert cached == fresh
+    assert cached[0] is not fresh[0] and cached[0][0] is not fresh[0][0]
+
+    # mutating a returned grid must not leak into later calls
+    cached[0][0][:] = [None] * 9
+    assert ticket_module.generate_unique_tickets(3, seed=321) == fresh
+
+    # unseeded calls are never cached
+    ticket_module.generate_unique_tickets(2)
+    assert all(key[1] is not None for key in ticket_module._TICKET_CACHE)
+
+
+def test_ticket_masks_match_number_sets():
+    t = ticket_module.generate_ticket_9x3(seed=11)
+    mask = ticket_module.ticket_mask(t)
+    assert {n for n in range(1, 91) if mask >> n & 1} == ticket_module.ticket_numbers_set(t)
+
+    rows = ticket_module.row_masks(t)
+    assert len(rows) == 3
+    assert ticket_module.check_line_complete_mask(rows, 0) is None
+    assert ticket_module.check_line_complete_mask(rows, rows[1]) == 1
+    assert not ticket_module.check_bingo_complete_mask(mask, rows[0] | rows[1])
+    assert ticket_module.check_bingo_complete_mask(mask, mask | (1 << 90))
+
+
+def test_released_grids_are_reused_empty():
+    t = ticket_module.generate_ticket_9x3(seed=5)
+    ticket_module.release_grid(t)
+
+    grid = ticket_module.acquire_grid()
+    assert grid is t
+    assert grid == [[None] * 9 for _ in range(3)]
+
+
+def test_flat_grid_round_trip():
+    grid = ticket_module.generate_ticket_9x3(seed=3)
+    flat = ticket_module.flatten_grid(grid)
+
+    assert len(flat) == 27
+    assert flat[1 * 9 + 4] == (grid[1][4] or 0)
+    assert ticket_module.unflatten_grid(flat) == grid
+    assert ticket_module.ticket_mask(flat) == ticket_module.ticket_mask(grid)
+    assert ticket_module.ticket_numbers_set(flat) == ticket_module.ticket_numbers_set(grid)
+    assert ticket_module.row_masks(flat) == ticket_module.row_masks(grid)
+    tracker = ticket_module.TicketTracker([grid, flat])
+    assert tracker.line_remaining == [[5, 5, 5], [5, 5, 5]]
+
+
+def test_generator_builds_valid_tickets_without_retries():
+    # construction is direct, so every seed must yield a valid ticket first time
+    for seed in range(500):
+        grid = ticket_module.generate_ticket_9x3(seed=seed)
+        assert [sum(1 for v in row if v is not None) for row in grid] == [5, 5, 5]
+        for c in range(9):
+            col_vals = [grid[r][c] for r in range(3) if grid[r][c] is not None]
+            assert 1 <= len(col_vals) <= 3
+            assert col_vals == sorted(col_vals)
+            assert all(v in _col_ranges()[c] for v in col_vals)
+
+
+def test_pick_k_sorted_returns_distinct_ascending_numbers_in_range():
+    getrandbits = random.Random(4).getrandbits
+    seen = set()
+    for _ in range(2000):
+        for k in (1, 2, 3):
+            picked = ticket_module._pick_k_sorted(getrandbits, 80, 11, k)
+            assert len(picked) == k
+            assert picked == sorted(set(picked))
+            assert all(80 <= n <= 90 for n in picked)
+            seen.update(picked)
+    # every number in the span is reachable, including the top one
+    assert seen == set(range(80, 91))
+
+
+def test_row_ties_are_broken_randomly():
+    # the same column counts must not always produce the same row layout
+    shapes = {}
+    for seed in range(300):
+        grid = ticket_module.generate_ticket_9x3(seed=seed)
+        shape = tuple(tuple(grid[r][c] is not None for r in range(3)) for c in range(9))
+        counts = tuple(sum(col) for col in shape)
+        shapes.setdefault(counts, set()).add(shape)
+    assert any(len(variants) > 1 for variants in shapes.values())